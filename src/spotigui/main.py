@@ -17,6 +17,7 @@ from spotigui.screens.init_screen import InitScreen
 from spotigui.screens.login_screen import LoginScreen
 from spotigui.screens.home_screen import HomeScreen
 from spotigui.screens.now_playing_screen import NowPlayingScreen
+from spotigui.widgets._kv_loader import load_widget_kv
 
 
 # Configure window size before importing any other Kivy widgets
@@ -31,6 +32,7 @@ class SpotiGuiApp(MDApp):
         super().__init__(**kwargs)
         self.title = APP_NAME
         self.spotify_api = SpotifyAPI()
+        self.spotify_api.on_auth_lost = self._on_auth_lost
         self.init_screen = None
         self.login_screen = None
         self.home_screen = None
@@ -54,6 +56,9 @@ class SpotiGuiApp(MDApp):
         self.theme_cls.theme_style = "Light"
         self.theme_cls.primary_palette = "Lightpink"
 
+        # Load widget KV rules once, before any screen instantiates them
+        load_widget_kv()
+
         # Create screen manager
         self.screen_manager = MDScreenManager()
 
@@ -119,6 +124,19 @@ class SpotiGuiApp(MDApp):
             else:
                 Logger.error("SpotiGUI: Failed to generate auth URL")
 
+    def _on_auth_lost(self):
+        """Send the user back to the login screen after the session expired."""
+        Logger.warning("SpotiGUI: Spotify session lost, showing login screen")
+        threading.Thread(target=self._request_login, daemon=True).start()
+
+    def _request_login(self):
+        """Generate a fresh auth URL and show the login screen."""
+        auth_url = self.spotify_api.get_auth_url()
+        if auth_url:
+            self._show_login_screen(auth_url)
+        else:
+            Logger.error("SpotiGUI: Failed to generate auth URL")
+
     @mainthread
     def _show_login_screen(self, auth_url: str):
         """Display login screen with QR code."""
@@ -157,13 +175,14 @@ class SpotiGuiApp(MDApp):
         else:
             Logger.warning("SpotiGUI: No Spotify devices found")
 
-        # Start polling for playback state
-        Logger.debug("SpotiGUI: Starting playback polling...")
-        self.stop_polling = False
-        self.playback_poll_thread = threading.Thread(
-            target=self._poll_playback_state, daemon=True
-        )
-        self.playback_poll_thread.start()
+        # Start polling for playback state (it keeps running across re-logins)
+        if not (self.playback_poll_thread and self.playback_poll_thread.is_alive()):
+            Logger.debug("SpotiGUI: Starting playback polling...")
+            self.stop_polling = False
+            self.playback_poll_thread = threading.Thread(
+                target=self._poll_playback_state, daemon=True
+            )
+            self.playback_poll_thread.start()
 
         # Navigate to home screen
         Logger.debug("SpotiGUI: Scheduling navigation to home screen in 0.5s")
@@ -2,7 +2,6 @@
 
 from typing import Optional, Callable, List, Dict, Any
 from kivymd.uix.screen import MDScreen
-from kivymd.uix.label import MDLabel
 from kivy.lang import Builder
 from kivy.logger import Logger
 
@@ -76,25 +75,15 @@ class HomeScreen(MDScreen):
             Logger.error("HomeScreen.add_playlists: playlists_list not found in ids!")
             return
 
-        self.ids.playlists_list.clear_widgets()
-
-        for playlist in playlists:
-            tile = PlaylistTile(
-                playlist_data=playlist,
-                on_select=self._on_playlist_select,
-            )
-            self.ids.playlists_list.add_widget(tile)
+        self.ids.loading_label.opacity = 0
+        self.ids.playlists_list.data = PlaylistTile.view_data(
+            playlists, on_select=self._on_playlist_select
+        )
 
     def show_loading(self):
         """Show loading indicator while fetching playlists."""
-        self.ids.playlists_list.clear_widgets()
-        loading_label = MDLabel(
-            text="Loading playlists...",
-            size_hint_y=None,
-            height="50dp",
-            halign="center",
-        )
-        self.ids.playlists_list.add_widget(loading_label)
+        self.ids.playlists_list.data = []
+        self.ids.loading_label.opacity = 1
 
     def _on_playlist_select(self, playlist_data: Dict[str, Any]):
         """Handle playlist selection."""
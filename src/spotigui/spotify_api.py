@@ -3,7 +3,7 @@ Spotify API wrapper using spotipy library.
 Handles authentication, playback control, device management, and playlist retrieval.
 """
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Callable, Dict, List, Any
 import logging
 import threading
 import spotipy
@@ -28,6 +28,12 @@ class SpotifyAPI:
         self.oauth_manager: Optional[SpotifyOAuth] = None
         self.callback_server: Optional[OAuthCallbackServer] = None
         self.callback_thread: Optional[threading.Thread] = None
+        # Cached authentication flag checked on every API call
+        self._auth_ok: bool = False
+        # Serializes token recovery when several threads hit a 401 at once
+        self._auth_lock = threading.Lock()
+        # Called (from any thread) when the session is lost and cannot be recovered
+        self.on_auth_lost: Optional[Callable[[], None]] = None
 
     def init_oauth_manager(self, open_browser: bool = False):
         """
@@ -118,6 +124,7 @@ class SpotifyAPI:
                 # Verify it works
                 self.sp.current_user()
                 Logger.info("SpotifyAPI: Successfully authenticated via callback URL")
+                self._auth_ok = True
                 return True
 
         except Exception as e:
@@ -144,12 +151,14 @@ class SpotifyAPI:
             if token_info and not self.oauth_manager.is_token_expired(token_info):
                 # Token exists and is valid, initialize Spotify client
                 if not self.sp:
-                    self.sp = spotipy.Spotify(auth_manager=self.oauth_manager)
-                    # Verify it works
-                    self.sp.current_user()
+                    sp = spotipy.Spotify(auth_manager=self.oauth_manager)
+                    # Verify it works before keeping the client
+                    sp.current_user()
+                    self.sp = sp
                     Logger.info("SpotifyAPI: Successfully authenticated with cached token")
                     # Stop callback server if running
                     self.stop_callback_server()
+                self._auth_ok = True
                 return True
 
             # Check if callback server received authorization code (non-blocking)
@@ -164,6 +173,7 @@ class SpotifyAPI:
                         self.sp.current_user()
                         Logger.info("SpotifyAPI: Successfully authenticated via callback server")
                         self.stop_callback_server()
+                        self._auth_ok = True
                         return True
 
         except SpotifyException as e:
@@ -189,6 +199,7 @@ class SpotifyAPI:
             # Test the connection by getting current user info
             self.sp.current_user()
             Logger.info("SpotifyAPI: Successfully authenticated with Spotify")
+            self._auth_ok = True
             return True
         except SpotifyException as e:
             Logger.error(f"SpotifyAPI: Spotify authentication failed: {e}")
@@ -199,7 +210,55 @@ class SpotifyAPI:
 
     def is_authenticated(self) -> bool:
         """Check if client is authenticated."""
-        return self.sp is not None
+        return self._auth_ok
+
+    def _handle_spotify_error(self, e: SpotifyException):
+        """
+        Try to recover from 401 responses by refreshing the access token.
+
+        If the refresh fails the session is dropped and on_auth_lost is
+        called so the app can ask the user to log in again.
+        """
+        if e.http_status != 401:
+            return
+        # Another thread is already recovering the session
+        if not self._auth_lock.acquire(blocking=False):
+            return
+        try:
+            Logger.warning("SpotifyAPI: Access token rejected, refreshing")
+            if self._refresh_auth():
+                Logger.info("SpotifyAPI: Access token refreshed")
+                return
+
+            Logger.warning("SpotifyAPI: Could not refresh access token, authentication required")
+            self._auth_ok = False
+            self.sp = None
+        finally:
+            self._auth_lock.release()
+
+        if self.on_auth_lost:
+            self.on_auth_lost()
+
+    def _refresh_auth(self) -> bool:
+        """
+        Force a token refresh and verify the client still works.
+
+        Returns:
+            bool: True if the session is usable again, False otherwise
+        """
+        if not self.oauth_manager or not self.sp:
+            return False
+
+        try:
+            token_info = self.oauth_manager.get_cached_token()
+            if not token_info or not token_info.get("refresh_token"):
+                return False
+            self.oauth_manager.refresh_access_token(token_info["refresh_token"])
+            self.sp.current_user()
+            return True
+        except Exception as e:
+            Logger.debug(f"SpotifyAPI: Token refresh failed: {e}")
+            return False
 
     def get_current_user_playlists(self, limit: int = 6, offset: int = 0) -> List[Dict[str, Any]]:
         """
@@ -212,13 +271,14 @@ class SpotifyAPI:
         Returns:
             List of playlist dictionaries with name, description, and images.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return []
 
         try:
             results = self.sp.current_user_playlists(limit=limit, offset=offset)
             return results.get("items", [])
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error fetching playlists: {e}")
             return []
         except Exception as e:
@@ -232,12 +292,13 @@ class SpotifyAPI:
         Returns:
             Dictionary with playback state or None if error.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return None
 
         try:
             return self.sp.current_playback()
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error fetching playback state: {e}")
             return None
         except Exception as e:
@@ -255,13 +316,14 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
             self.sp.start_playback(device_id=device_id, context_uri=context_uri)
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error starting playback: {e}")
             return False
         except Exception as e:
@@ -278,13 +340,14 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
             self.sp.pause_playback(device_id=device_id)
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error pausing playback: {e}")
             return False
         except Exception as e:
@@ -301,13 +364,14 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
             self.sp.next_track(device_id=device_id)
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error skipping to next track: {e}")
             return False
         except Exception as e:
@@ -324,13 +388,14 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
             self.sp.previous_track(device_id=device_id)
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error skipping to previous track: {e}")
             return False
         except Exception as e:
@@ -348,13 +413,14 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
             self.sp.volume(volume_percent, device_id=device_id)
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error setting volume: {e}")
             return False
         except Exception as e:
@@ -368,13 +434,14 @@ class SpotifyAPI:
         Returns:
             List of device dictionaries with id, name, type, and is_active.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return []
 
         try:
             devices = self.sp.devices()
             return devices.get("devices", [])
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error fetching devices: {e}")
             return []
         except Exception as e:
@@ -392,7 +459,7 @@ class SpotifyAPI:
         Returns:
             bool: True if successful, False otherwise.
         """
-        if not self.is_authenticated():
+        if not self._auth_ok:
             return False
 
         try:
@@ -400,6 +467,7 @@ class SpotifyAPI:
             Logger.info(f"SpotifyAPI: Transferred playback to device {device_id}")
             return True
         except SpotifyException as e:
+            self._handle_spotify_error(e)
             Logger.error(f"SpotifyAPI: Spotify error transferring playback: {e}")
             return False
         except Exception as e:
@@ -0,0 +1,165 @@
+"""Shared cover image loader with in-memory and on-disk caches."""
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+from PIL import Image as PILImage
+from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics.texture import Texture
+from kivy.logger import Logger
+from kivy.metrics import dp, sp
+from kivy.weakmethod import WeakMethod
+
+from spotigui.config import CACHE_DIR
+
+# Maximum number of cover textures kept in memory
+CACHE_SIZE = 256
+
+# Largest size (in pixels) covers are displayed at; bigger images are downscaled
+COVER_SIZE = int(dp(320))
+
+# Downloaded cover images persist here across runs
+COVERS_DIR = CACHE_DIR / "covers"
+
+# Downloads share one pool of workers and one keep-alive HTTP session
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cover")
+_session = requests.Session()
+_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+)
+
+_textures: "OrderedDict[str, Texture]" = OrderedDict()
+_pending: Dict[str, List[WeakMethod]] = {}
+_placeholder: Optional[Texture] = None
+
+
+def placeholder_texture() -> Texture:
+    """Return the shared texture shown on tiles without a cover."""
+    global _placeholder
+    if _placeholder is None:
+        label = CoreLabel(text="♫", font_size=sp(64))
+        label.refresh()
+        _placeholder = label.texture
+    return _placeholder
+
+
+def get_texture(url: str, callback: Callable[[str, Texture], None]):
+    """
+    Resolve an image URL to a texture.
+
+    Textures cached in memory are passed to the callback immediately.
+    Otherwise the image is read from the disk cache, or downloaded into it
+    first, and every callback registered for the same URL in the meantime
+    receives the result. Pending callbacks are held weakly, so widgets
+    destroyed before their cover arrives are simply skipped.
+
+    Args:
+        url: Image URL to load
+        callback: Called on the main thread with the URL and loaded texture
+    """
+    texture = _textures.get(url)
+    if texture is not None:
+        _textures.move_to_end(url)
+        callback(url, texture)
+        return
+
+    waiters = _pending.get(url)
+    if waiters is not None:
+        waiters.append(WeakMethod(callback))
+        return
+
+    _pending[url] = [WeakMethod(callback)]
+    path = _cache_path(url)
+    if os.path.exists(path):
+        _executor.submit(_read_cover, url, path)
+    else:
+        _executor.submit(_fetch_cover, url, path)
+
+
+def _cache_path(url: str) -> str:
+    """Return the on-disk cache path for an image URL."""
+    # Spotify serves JPEG covers and they are re-encoded as JPEG on download
+    name = hashlib.sha1(url.encode("utf-8")).hexdigest() + ".jpg"
+    return str(COVERS_DIR / name)
+
+
+def _read_cover(url: str, path: str):
+    """Decode a cover from the disk cache (runs on a worker thread)."""
+    try:
+        with PILImage.open(path) as image:
+            image = image.convert("RGB")
+            size, pixels = image.size, image.tobytes()
+    except Exception as e:
+        Logger.error(f"ImageCache: Failed to read cached cover {url}: {e}")
+        Clock.schedule_once(lambda dt: _on_error(url, path), 0)
+        return
+
+    Clock.schedule_once(lambda dt: _on_load(url, size, pixels), 0)
+
+
+def _fetch_cover(url: str, path: str):
+    """Fetch, downscale and store a cover image (runs on a worker thread)."""
+    part_path = path + ".part"
+    try:
+        response = _session.get(url, timeout=10)
+        response.raise_for_status()
+
+        image = PILImage.open(io.BytesIO(response.content))
+        image.thumbnail((COVER_SIZE, COVER_SIZE), PILImage.Resampling.BILINEAR)
+        image = image.convert("RGB")
+        size, pixels = image.size, image.tobytes()
+
+        COVERS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(part_path, "wb") as f:
+            image.save(f, format="JPEG", quality=85)
+            # Make sure the file is on disk before it replaces the cache entry,
+            # so a power cut cannot leave a truncated cover behind
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(part_path, path)
+    except Exception as e:
+        Logger.error(f"ImageCache: Failed to fetch cover {url}: {e}")
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        Clock.schedule_once(lambda dt: _on_error(url, path), 0)
+        return
+
+    Clock.schedule_once(lambda dt: _on_load(url, size, pixels), 0)
+
+
+def _on_load(url: str, size, pixels: bytes):
+    """Upload decoded pixels to a texture and notify waiting callbacks."""
+    texture = Texture.create(size=size, colorfmt="rgb")
+    texture.blit_buffer(pixels, colorfmt="rgb", bufferfmt="ubyte")
+    # PIL rows run top to bottom, OpenGL textures bottom to top
+    texture.flip_vertical()
+
+    _textures[url] = texture
+    _textures.move_to_end(url)
+    while len(_textures) > CACHE_SIZE:
+        _textures.popitem(last=False)
+
+    for ref in _pending.pop(url, []):
+        callback = ref()
+        if callback is not None:
+            callback(url, texture)
+
+
+def _on_error(url: str, path: Optional[str] = None):
+    """Drop waiting callbacks for an image that failed to load."""
+    _pending.pop(url, None)
+    # Remove an undecodable cached file so the next request downloads it again
+    if path is not None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    Logger.warning(f"ImageCache: Failed to load image {url}")
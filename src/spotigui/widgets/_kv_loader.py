@@ -0,0 +1,34 @@
+"""One-shot loading of widget KV files."""
+
+from typing import Set
+
+from kivy.lang import Builder
+
+from spotigui import resource_path
+
+# KV rules for the reusable widgets, loaded once before any screen is built
+WIDGET_KV_FILES = (
+    "src/spotigui/widgets/playlist_tile.kv",
+    "src/spotigui/widgets/topbar.kv",
+    "src/spotigui/widgets/playback_controls.kv",
+)
+
+_loaded: Set[str] = set()
+
+
+def load_once(path: str):
+    """
+    Load a KV file unless it has already been loaded.
+
+    Args:
+        path: KV file path relative to the project root
+    """
+    if path not in _loaded:
+        Builder.load_file(resource_path(path))
+        _loaded.add(path)
+
+
+def load_widget_kv():
+    """Load the KV rules of all widgets in this package."""
+    for path in WIDGET_KV_FILES:
+        load_once(path)
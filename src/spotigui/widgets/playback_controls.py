@@ -3,14 +3,8 @@
 from typing import Optional, Callable
 from kivymd.uix.bottomsheet import MDBottomSheet
 from kivy.properties import BooleanProperty
-from kivy.lang import Builder
 from kivy.clock import Clock
 
-from spotigui import resource_path
-
-# Load the KV file
-Builder.load_file(resource_path("src/spotigui/widgets/playback_controls.kv"))
-
 
 class PlaybackControlsSheet(MDBottomSheet):
     """Bottom sheet containing playback controls."""
@@ -46,6 +40,11 @@ class PlaybackControlsSheet(MDBottomSheet):
         self.on_mute_toggle_callback = on_mute_toggle
         
         self.auto_close_event = None
+        self._pending_toggle = None
+        self._state_before_toggle = False
+        # Polled states are ignored until they match the last sent toggle
+        self._awaiting_state: Optional[bool] = None
+        self._awaiting_timeout = None
 
     def set_playing_state(self, is_playing: bool):
         """
@@ -54,16 +53,51 @@ class PlaybackControlsSheet(MDBottomSheet):
         Args:
             is_playing: True if track is playing, False otherwise
         """
-        self.is_playing = is_playing
+        # Keep the optimistic state while a local toggle is waiting to be sent
+        # or until Spotify reports the state that was sent
+        if self._pending_toggle:
+            return
+        if self._awaiting_state is not None:
+            if is_playing != self._awaiting_state:
+                return
+            self._stop_awaiting()
+        if self.is_playing != is_playing:
+            self.is_playing = is_playing
 
     def _on_play_pause(self, _instance):
         """Handle play/pause button press."""
-        if self.is_playing:
-            if self.on_pause_callback:
-                self.on_pause_callback()
+        # Flip the icon right away, but only send the final state of a rapid
+        # sequence of presses to Spotify
+        if self._pending_toggle:
+            self._pending_toggle.cancel()
         else:
+            self._state_before_toggle = self.is_playing
+        self.is_playing = not self.is_playing
+        self._pending_toggle = Clock.schedule_once(self._commit_toggle, 0.15)
+
+    def _commit_toggle(self, _dt):
+        """Send the pending play/pause transition."""
+        self._pending_toggle = None
+        if self.is_playing == self._state_before_toggle:
+            return
+
+        self._stop_awaiting()
+        self._awaiting_state = self.is_playing
+        self._awaiting_timeout = Clock.schedule_once(lambda dt: self._stop_awaiting(), 2)
+
+        if self.is_playing:
             if self.on_play_callback:
                 self.on_play_callback()
+        else:
+            if self.on_pause_callback:
+                self.on_pause_callback()
+
+    def _stop_awaiting(self):
+        """Accept polled play/pause states again."""
+        if self._awaiting_timeout:
+            self._awaiting_timeout.cancel()
+            self._awaiting_timeout = None
+        self._awaiting_state = None
 
     def _on_next(self, _instance=None):
         """Handle next track action."""
@@ -107,4 +141,8 @@ class PlaybackControlsSheet(MDBottomSheet):
         if self.auto_close_event:
             self.auto_close_event.cancel()
             self.auto_close_event = None
+        # Send a play/pause toggle that is still waiting out its debounce
+        if self._pending_toggle:
+            self._pending_toggle.cancel()
+            self._commit_toggle(0)
         super().on_dismiss()
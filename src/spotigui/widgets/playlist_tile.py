@@ -1,28 +1,32 @@
 """Playlist tile widget for displaying playlists in grid."""
 
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Dict, Any
 from kivymd.uix.card import MDCard
-from kivy.properties import ObjectProperty, DictProperty, StringProperty
-from kivy.lang import Builder
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import StringProperty
+from kivy.weakmethod import WeakMethod
 
-from spotigui import resource_path
+from spotigui.widgets._image_cache import COVER_SIZE, get_texture
 
-# Load the KV file
-Builder.load_file(resource_path("src/spotigui/widgets/playlist_tile.kv"))
 
+class PlaylistTile(RecycleDataViewBehavior, MDCard):
+    """A tile widget representing a single Spotify playlist.
 
-class PlaylistTile(MDCard):
-    """A tile widget representing a single Spotify playlist."""
-
-    playlist_data = DictProperty({})
-    on_playlist_select = ObjectProperty(None)
+    Tiles can be built directly from playlist data, or used as the
+    viewclass of a RecycleView fed with ``PlaylistTile.view_data()``.
+    """
 
     # Properties for KV bindings
     image_url = StringProperty("")
     playlist_name = StringProperty("Unknown Playlist")
     track_count_text = StringProperty("")
 
-    def __init__(self, playlist_data: dict, on_select: Optional[Callable] = None, **kwargs):
+    def __init__(
+        self,
+        playlist_data: Optional[dict] = None,
+        on_select: Optional[Callable] = None,
+        **kwargs
+    ):
         """
         Initialize playlist tile.
 
@@ -30,47 +34,94 @@ class PlaylistTile(MDCard):
             playlist_data: Dictionary containing playlist information (name, images, etc.)
             on_select: Callback function when tile is tapped
         """
+        # Pass display properties to super().__init__ so the KV rules are
+        # evaluated once with final values instead of being re-dispatched
+        if playlist_data and "playlist_name" not in kwargs:
+            kwargs.update(self._extract_properties(playlist_data))
         super().__init__(**kwargs)
-        self.playlist_data = playlist_data
-        self.on_playlist_select = on_select
-        self._update_properties()
-
-    def _update_properties(self):
-        """Update properties from playlist data for KV bindings."""
-        # Extract image URL
-        images = self.playlist_data.get("images", [])
-        if images and len(images) > 0:
-            # Try to get the URL, handling both dict and direct URL cases
-            self.image_url = images[0] if isinstance(images[0], str) else images[0].get("url", "")
+        # Plain attributes: nothing binds to these, so skip property dispatch.
+        # The callback is held weakly so tiles never keep their screen alive.
+        self._playlist_data = playlist_data or {}
+        self._on_select_ref = WeakMethod(on_select) if on_select else None
+
+        self._load_cover()
+
+    @classmethod
+    def view_data(
+        cls, playlists: List[Dict[str, Any]], on_select: Optional[Callable] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build RecycleView data for a list of playlists.
+
+        All playlist data is parsed in one pass before any widget is bound.
+
+        Args:
+            playlists: List of playlist dictionaries from Spotify API
+            on_select: Callback function when a tile is tapped
+
+        Returns:
+            List of view attribute dictionaries in the same order as playlists
+        """
+        on_select_ref = WeakMethod(on_select) if on_select else None
+        data = []
+        for playlist in playlists:
+            attrs = cls._extract_properties(playlist)
+            attrs["_playlist_data"] = playlist
+            attrs["_on_select_ref"] = on_select_ref
+            data.append(attrs)
+        return data
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind the recycled tile to a new playlist."""
+        super().refresh_view_attrs(rv, index, data)
+        self._load_cover()
+
+    @staticmethod
+    def _extract_properties(playlist_data: dict) -> dict:
+        """Extract KV-bound display properties from playlist data."""
+        # Read each field once; images and tracks may also be null in API data
+        name = playlist_data.get("name", "Unknown Playlist")
+        images = playlist_data.get("images") or ()
+        tracks = playlist_data.get("tracks") or {}
+        track_count = tracks.get("total", 0)
+
+        # Extract image URL, handling both dict and direct URL cases
+        if not images:
+            image_url = ""
+        elif isinstance(images[0], str):
+            image_url = images[0]
         else:
-            self.image_url = ""
-
-        # Extract playlist name
-        self.playlist_name = self.playlist_data.get("name", "Unknown Playlist")
-
-        # Extract track count
-        track_count = self.playlist_data.get("tracks", {}).get("total", 0)
-        self.track_count_text = f"{track_count} tracks" if track_count else ""
-
-    def on_press(self, press):
-        return super(PlaylistTile, self).on_press(press)
-
-    def on_touch_down(self, touch):
-        """Handle touch down event with proper collision detection."""
-        if self.collide_point(*touch.pos):
-            # Grab the touch for this widget
-            touch.grab(self)
-            return True
-        return super(PlaylistTile, self).on_touch_down(touch)
-
-    def on_touch_up(self, touch):
-        """Handle touch up event to trigger playlist selection."""
-        # Check if this touch was grabbed by this widget
-        if touch.grab_current is self:
-            # Release the touch
-            touch.ungrab(self)
-            # Trigger the selection callback
-            if self.on_playlist_select:
-                self.on_playlist_select(self.playlist_data)
-            return True
-        return super(PlaylistTile, self).on_touch_up(touch)
+            image_url = PlaylistTile._pick_image(images).get("url", "")
+
+        return {
+            "image_url": image_url or "",
+            "playlist_name": name,
+            "track_count_text": f"{track_count} tracks" if track_count else "",
+        }
+
+    @staticmethod
+    def _pick_image(images: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pick the smallest image still large enough to fill the tile."""
+        # Spotify lists images largest first; width is None for some uploads
+        large_enough = [image for image in images if (image.get("width") or 0) >= COVER_SIZE]
+        if not large_enough:
+            return images[0]
+        return min(large_enough, key=lambda image: image["width"])
+
+    def _load_cover(self):
+        """Request the cover texture for the current image URL."""
+        self.ids.playlist_image.texture = None
+        if self.image_url:
+            get_texture(self.image_url, self._on_texture_ready)
+
+    def _on_texture_ready(self, url: str, texture):
+        """Display the cover texture resolved by the shared image cache."""
+        # Ignore covers that arrive after the tile was recycled
+        if url == self.image_url:
+            self.ids.playlist_image.texture = texture
+
+    def on_release(self):
+        """Trigger playlist selection when the tile is tapped."""
+        callback = self._on_select_ref() if self._on_select_ref else None
+        if callback:
+            callback(self._playlist_data)
@@ -1,17 +1,25 @@
 # -*- coding: utf-8 -*-
 """Top bar widget with back button, title, and device selector."""
 
+import threading
+from functools import lru_cache, partial
 from typing import Optional, Callable, List, Dict, Any
 from kivymd.uix.appbar import MDTopAppBar
 from kivymd.uix.menu import MDDropdownMenu
 from kivymd.uix.menu.menu import MDDropdownTextItem  # Explicitly import to register
-from kivy.lang import Builder
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.metrics import dp
 from kivy.properties import StringProperty
 
-from spotigui import resource_path
 
-# Load the KV file
-Builder.load_file(resource_path("src/spotigui/widgets/topbar.kv"))
+@lru_cache(maxsize=64)
+def _format_device_text(name: str, device_type: str, is_active: bool) -> str:
+    """Format a device menu entry, e.g. "[Active] Kitchen (Speaker)"."""
+    parts = ["[Active] " if is_active else "", name]
+    if device_type:
+        parts.append(f" ({device_type})")
+    return "".join(parts)
 
 
 class TopBarWidget(MDTopAppBar):
@@ -46,9 +54,11 @@ class TopBarWidget(MDTopAppBar):
         self.on_back_callback = on_back
         self.on_device_select_callback = on_device_select
         self.on_device_refresh_callback = on_device_refresh# RGBA format (values 0-1)
-        # Menu for device selection
-        self.device_menu = None
+        # Menu for device selection, created up front so the first press
+        # does not pay for its construction
+        self.device_menu = MDDropdownMenu(items=[], max_height=dp(200))
         self.current_devices = []
+        self._refresh_in_flight = False
 
     def set_track_name(self, track_name: str):
         """Update the track name text."""
@@ -61,56 +71,56 @@ class TopBarWidget(MDTopAppBar):
 
     def _on_device_button_press(self, _instance):
         """Handle device button press to show device menu."""
-        # Request fresh device list
-        if self.on_device_refresh_callback:
+        # Ignore repeated presses while a refresh is already running
+        if not self.on_device_refresh_callback or self._refresh_in_flight:
+            return
+
+        # Request fresh device list without blocking the UI
+        self._refresh_in_flight = True
+        threading.Thread(target=self._refresh_devices, daemon=True).start()
+
+    def _refresh_devices(self):
+        """Fetch available devices (runs in a background thread)."""
+        try:
             devices = self.on_device_refresh_callback()
-            if devices:
-                self.update_device_menu(devices)
-                # Set caller and open menu
-                if self.device_menu:
-                    self.device_menu.caller = self.ids.device_btn
-                    self.device_menu.open()
+        except Exception as e:
+            Logger.error(f"TopBarWidget: Failed to refresh devices: {e}")
+            devices = []
+        Clock.schedule_once(lambda dt: self._finish_device_refresh(devices), 0)
+
+    def _finish_device_refresh(self, devices: List[Dict[str, Any]]):
+        """Show the refreshed device menu (runs on main thread)."""
+        self._refresh_in_flight = False
+        if devices:
+            self.update_device_menu(devices)
+            # Set caller and open menu
+            self.device_menu.caller = self.ids.device_btn
+            self.device_menu.open()
 
     def update_device_menu(self, devices: List[Dict[str, Any]]):
         """Update the device selection menu with available devices."""
         self.current_devices = devices
 
         # Create menu items
-        menu_items = []
-        for device in devices:
-            device_name = device.get("name", "Unknown Device")
-            device_type = device.get("type", "")
-            is_active = device.get("is_active", False)
-
-            # Format device name with type
-            text = device_name
-            if device_type:
-                text += f" ({device_type})"
-
-            # Add [Active] prefix for active device
-            if is_active:
-                text = f"[Active] {text}"
-
-            menu_items.append({
-                "text": text,
-                "on_release": lambda x=device: self._select_device(x),
+        menu_items = [
+            {
+                "text": _format_device_text(
+                    device.get("name", "Unknown Device"),
+                    device.get("type", ""),
+                    device.get("is_active", False),
+                ),
+                "on_release": partial(self._select_device, device),
                 "viewclass": "MDDropdownTextItem",
-            })
+            }
+            for device in devices
+        ]
 
-        # Create or update menu (without caller initially)
-        if not self.device_menu:
-            self.device_menu = MDDropdownMenu(
-                items=menu_items,
-                max_height="200dp",
-            )
-        else:
-            self.device_menu.items = menu_items
+        self.device_menu.items = menu_items
 
     def _select_device(self, device: Dict[str, Any]):
         """Handle device selection."""
         # Close the menu first
-        if self.device_menu:
-            self.device_menu.dismiss()
+        self.device_menu.dismiss()
 
         # Then handle the selection
         device_id = device.get("id")
@@ -1,21 +1,53 @@
 """Track progress bar widget showing playback position and time remaining."""
 
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivy.properties import NumericProperty, StringProperty
-from kivy.lang import Builder
 
-from spotigui import resource_path
+from spotigui.widgets._kv_loader import load_once
 
-# Load the KV file
-Builder.load_file(resource_path("src/spotigui/widgets/track_progress.kv"))
+# Zero-padded "00".."99" strings used to build MM:SS without formatting
+_TWO_DIGITS = tuple(f"{n:02d}" for n in range(100))
+
+
+def _format_time(seconds: int) -> str:
+    """
+    Format seconds to MM:SS format.
+
+    Args:
+        seconds: Number of seconds
+
+    Returns:
+        Formatted time string (MM:SS)
+    """
+    minutes, secs = divmod(seconds, 60)
+    if 0 <= minutes < 100:
+        return _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[secs]
+    return f"{minutes:02d}:{secs:02d}"
 
 
 class TrackProgressWidget(MDBoxLayout):
     """Widget displaying track progress bar with current time and time remaining."""
 
-    progress_value = NumericProperty(0)
-    current_time_text = StringProperty("00:00")
-    time_remaining_text = StringProperty("00:00")
+    def __init__(self, **kwargs):
+        # Only the now playing screen uses this widget, so its rules are
+        # loaded on first instantiation rather than at startup
+        load_once("src/spotigui/widgets/track_progress.kv")
+        super().__init__(**kwargs)
+        # Last (second, duration) seen, to skip polls that change nothing
+        self._last_tick = (-1, -1)
+        # Last values written to the labels, to skip redundant updates
+        self._last_current_sec = -1
+        self._last_remaining_sec = -1
+        # Percent per second of the current track, recomputed on duration change
+        self._cached_duration_ms = -1
+        self._progress_scale = 0.0
+
+    def on_kv_post(self, base_widget):
+        """Called after the KV file has been applied."""
+        super().on_kv_post(base_widget)
+        # Child widgets are written directly rather than through bound properties
+        self._bar = self.ids.progress_bar
+        self._current_label = self.ids.current_time_label
+        self._remaining_label = self.ids.time_remaining_label
 
     def update_progress(self, current_pos_ms: int, duration_ms: int):
         """
@@ -25,34 +57,31 @@ class TrackProgressWidget(MDBoxLayout):
             current_pos_ms: Current playback position in milliseconds
             duration_ms: Total track duration in milliseconds
         """
+        # Nothing to draw while the owning screen is not displayed
+        if self.get_parent_window() is None:
+            return
+
         current_sec = current_pos_ms // 1000
+        tick = (current_sec, duration_ms)
+        if tick == self._last_tick:
+            return
+        self._last_tick = tick
+
         duration_sec = duration_ms // 1000
+        if duration_ms != self._cached_duration_ms:
+            self._cached_duration_ms = duration_ms
+            self._progress_scale = 100.0 / duration_sec if duration_sec > 0 else 0.0
+        remaining_sec = duration_sec - current_sec if duration_sec > 0 else 0
 
         # Update current time
-        self.current_time_text = self._format_time(current_sec)
+        if current_sec != self._last_current_sec:
+            self._last_current_sec = current_sec
+            self._current_label.text = _format_time(current_sec)
 
-        # Update progress bar
-        if duration_sec > 0:
-            self.progress_value = (current_sec / duration_sec) * 100
-
-            # Calculate and update time remaining
-            remaining_sec = duration_sec - current_sec
-            self.time_remaining_text = self._format_time(remaining_sec)
-        else:
-            self.progress_value = 0
-            self.time_remaining_text = "00:00"
-
-    @staticmethod
-    def _format_time(seconds: int) -> str:
-        """
-        Format seconds to MM:SS format.
-
-        Args:
-            seconds: Number of seconds
+        # Update time remaining
+        if remaining_sec != self._last_remaining_sec:
+            self._last_remaining_sec = remaining_sec
+            self._remaining_label.text = _format_time(remaining_sec)
 
-        Returns:
-            Formatted time string (MM:SS)
-        """
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+        # Update progress bar
+        self._bar.value = current_sec * self._progress_scale